@@ -7,52 +7,334 @@ This script converts the Markdown guide to HTML and sets up GitHub Pages deploym
 
 import os
 import sys
-import subprocess
-import shutil
+import base64
+import functools
+import gzip
+import hashlib
+import itertools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-import markdown
 import re
 
-def run_command(command, check=True, capture_output=True):
-    """Run a shell command and return the result."""
+def run_command(argv, check=True, capture_output=True):
+    """Run a command (given as an argv list, no shell) and return the result."""
+    import subprocess
+    
     try:
         result = subprocess.run(
-            command, 
-            shell=True, 
+            argv, 
             check=check, 
             capture_output=capture_output,
-            text=True
+            # Decoding is only needed when there is captured output to read
+            text=capture_output
         )
         return result
     except subprocess.CalledProcessError as e:
-        print(f"Error running command: {command}")
+        print(f"Error running command: {' '.join(argv)}")
         print(f"Error: {e}")
         if capture_output:
             print(f"stdout: {e.stdout}")
             print(f"stderr: {e.stderr}")
         return None
 
+# "name[extras]==version" with the extras and pin optional; any other
+# specifier (>=, ~=, ...) leaves the version unchecked
+_REQUIREMENT_RE = re.compile(r'([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*(?:==\s*([^\s,;]+)\s*$)?')
+
 def install_dependencies():
-    """Install required Python packages."""
+    """Install the Python packages pinned in requirements.txt."""
+    from importlib.metadata import PackageNotFoundError, version
+    
     print("Installing dependencies...")
-    packages = ["markdown", "PyGithub"]
+    # Same pins CI installs, so local builds use the same converter
+    requirements_file = Path(__file__).with_name("requirements.txt")
+    try:
+        lines = requirements_file.read_text(encoding="utf-8").splitlines()
+        pip_args = ["-r", str(requirements_file)]
+    except FileNotFoundError:
+        print(f"Warning: {requirements_file} not found; checking markdown unpinned")
+        lines = pip_args = ["markdown"]
     
-    for package in packages:
+    # Look up installed distributions by their PyPI name; this reads package
+    # metadata only and never imports (or executes) the packages themselves
+    changes = []
+    for line in lines:
+        match = _REQUIREMENT_RE.match(line.split("#", 1)[0].strip())
+        if not match:
+            continue
+        package, pinned = match.groups()
         try:
-            import importlib
-            importlib.import_module(package.replace("-", "_"))
-            print(f"✓ {package} already installed")
-        except ImportError:
-            print(f"Installing {package}...")
-            result = run_command(f"pip install {package}")
-            if result is None:
-                print(f"Failed to install {package}")
-                return False
+            installed = version(package)
+        except PackageNotFoundError:
+            changes.append(f"{package} (not installed -> {pinned or 'latest'})")
+            continue
+        if pinned and installed != pinned:
+            changes.append(f"{package} ({installed} -> {pinned})")
+        else:
+            print(f"✓ {package} {installed} already installed")
+    
+    if changes:
+        print(f"Installing {', '.join(changes)}...")
+        # pip's progress goes straight to the terminal; nothing reads it back
+        result = run_command(
+            [
+                sys.executable, "-m", "pip", "install",
+                "--disable-pip-version-check", "--no-input",
+                *pip_args
+            ],
+            capture_output=False
+        )
+        if result is None:
+            print(f"Failed to install {', '.join(changes)}")
+            return False
     return True
 
-def create_html_template():
-    """Create a calm, minimal HTML template for the GitHub Pages site."""
-    return """<!DOCTYPE html>
+# Site stylesheet, served as docs/assets/style.css so browsers and CDNs cache
+# it across pages and visits instead of receiving it inline with every page.
+_CSS = """:root {
+    --primary-color: #2d3748; /* calm dark blue-gray */
+    --primary-hover: #1a202c;
+    --secondary-color: #4a5568;
+    --background-color: #f7fafc;
+    --surface-color: #ffffff;
+    --border-color: #e2e8f0;
+    --text-primary: #22223b;
+    --text-secondary: #4a5568;
+    --code-bg: #f1f5f9;
+    --shadow-sm: 0 1px 2px 0 rgb(0 0 0 / 0.03);
+    --shadow-md: 0 4px 6px -1px rgb(0 0 0 / 0.05), 0 2px 4px -2px rgb(0 0 0 / 0.05);
+}
+body {
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: var(--background-color);
+    color: var(--text-primary);
+    margin: 0;
+    padding: 0;
+    min-height: 100vh;
+}
+.container {
+    max-width: 900px;
+    margin: 0 auto;
+    padding: 2rem 1rem;
+}
+.header {
+    background: var(--surface-color);
+    border-bottom: 1px solid var(--border-color);
+    position: sticky;
+    top: 0;
+    z-index: 100;
+    box-shadow: var(--shadow-sm);
+}
+.header-content {
+    display: flex;
+    align-items: center;
+    padding: 1rem 0;
+}
+.logo {
+    display: flex;
+    align-items: center;
+    gap: 0.75rem;
+    text-decoration: none;
+    color: var(--primary-color);
+}
+.logo-icon {
+    width: 36px;
+    height: 36px;
+    background: var(--primary-color);
+    border-radius: 6px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    color: #fff;
+    font-weight: 700;
+    font-size: 1.1rem;
+}
+.logo-text {
+    font-size: 1.3rem;
+    font-weight: 700;
+    color: var(--primary-color);
+}
+.main-content {
+    background: var(--surface-color);
+    border-radius: 12px;
+    box-shadow: var(--shadow-md);
+    margin: 2rem 0;
+    overflow: hidden;
+}
+.markdown-body {
+    box-sizing: border-box;
+    min-width: 200px;
+    max-width: none;
+    margin: 0;
+    padding: 2.5rem 2rem;
+    background: var(--surface-color);
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    color: var(--text-primary);
+}
+.markdown-body h1 {
+    font-size: 2.2rem;
+    font-weight: 700;
+    color: var(--primary-color);
+    margin-bottom: 1.2rem;
+    border-bottom: 2px solid var(--border-color);
+    padding-bottom: 0.5rem;
+}
+.markdown-body h2 {
+    font-size: 1.5rem;
+    font-weight: 600;
+    color: var(--primary-color);
+    margin-top: 2rem;
+    margin-bottom: 1rem;
+    border-bottom: 1px solid var(--border-color);
+    padding-bottom: 0.3rem;
+}
+.markdown-body h3 {
+    font-size: 1.15rem;
+    font-weight: 600;
+    color: var(--primary-color);
+    margin-top: 1.5rem;
+    margin-bottom: 0.75rem;
+}
+.markdown-body h4 {
+    font-size: 1.05rem;
+    font-weight: 600;
+    color: var(--primary-color);
+    margin-top: 1.2rem;
+    margin-bottom: 0.5rem;
+}
+.markdown-body p {
+    margin-bottom: 1.1rem;
+    color: var(--text-secondary);
+}
+.markdown-body strong {
+    color: var(--text-primary);
+    font-weight: 600;
+}
+.markdown-body code {
+    background: var(--code-bg);
+    color: var(--primary-color);
+    padding: 0.18rem 0.35rem;
+    border-radius: 4px;
+    font-size: 0.95em;
+    border: 1px solid var(--border-color);
+}
+.markdown-body pre {
+    background: var(--code-bg);
+    border-radius: 8px;
+    padding: 1.1rem;
+    overflow-x: auto;
+    border: 1px solid var(--border-color);
+}
+.markdown-body pre code {
+    background: none;
+    color: var(--primary-color);
+    padding: 0;
+    border: none;
+    font-size: 0.95em;
+}
+.markdown-body blockquote {
+    background: #f1f5f9;
+    color: var(--primary-color);
+    padding: 1rem 1.5rem;
+    border-radius: 6px;
+    margin: 1.2rem 0;
+    border-left: 4px solid var(--primary-color);
+}
+.markdown-body blockquote p {
+    color: var(--primary-color);
+    margin: 0;
+}
+.markdown-body table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 1.2rem 0;
+    border-radius: 6px;
+    overflow: hidden;
+}
+.markdown-body th {
+    background: var(--primary-color);
+    color: #fff;
+    padding: 0.7rem;
+    text-align: left;
+    font-weight: 600;
+}
+.markdown-body td {
+    padding: 0.7rem;
+    border-bottom: 1px solid var(--border-color);
+    background: var(--surface-color);
+}
+.markdown-body tr:nth-child(even) td {
+    background: #f7fafc;
+}
+.markdown-body ul, .markdown-body ol {
+    padding-left: 1.3rem;
+    margin-bottom: 1.1rem;
+}
+.markdown-body li {
+    margin-bottom: 0.4rem;
+    color: var(--text-secondary);
+}
+.markdown-body a {
+    color: var(--primary-color);
+    text-decoration: underline;
+    font-weight: 500;
+    transition: color 0.2s ease;
+}
+.markdown-body a:hover {
+    color: var(--primary-hover);
+}
+.gh-link {
+    margin-left: auto;
+    margin-right: 1rem;
+    color: var(--primary-color);
+    font-weight: 600;
+    text-decoration: none;
+}
+.gh-link:hover {
+    color: var(--primary-hover);
+    text-decoration: underline;
+}
+.footer {
+    background: var(--surface-color);
+    border-top: 1px solid var(--border-color);
+    padding: 1.5rem 0;
+    text-align: center;
+    color: var(--text-secondary);
+    margin-top: 2rem;
+}
+.footer-content {
+    max-width: 900px;
+    margin: 0 auto;
+}
+.footer a {
+    color: var(--primary-color);
+    text-decoration: underline;
+    font-weight: 500;
+}
+.footer a:hover {
+    color: var(--primary-hover);
+}
+@media (max-width: 768px) {
+    .container {
+        padding: 1rem;
+    }
+    .header-content {
+        padding: 1rem 0;
+    }
+    .markdown-body {
+        padding: 1rem 0.5rem;
+    }
+    .main-content {
+        margin: 1rem 0;
+    }
+    .logo-text {
+        font-size: 1rem;
+    }
+}
+"""
+
+# Calm, minimal HTML template for the GitHub Pages site.
+_HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -61,285 +343,23 @@ def create_html_template():
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/github-markdown-css/5.2.0/github-markdown.min.css">
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap" rel="stylesheet">
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/themes/prism.min.css">
-    <style>
-        :root {{
-            --primary-color: #2d3748; /* calm dark blue-gray */
-            --primary-hover: #1a202c;
-            --secondary-color: #4a5568;
-            --background-color: #f7fafc;
-            --surface-color: #ffffff;
-            --border-color: #e2e8f0;
-            --text-primary: #22223b;
-            --text-secondary: #4a5568;
-            --code-bg: #f1f5f9;
-            --shadow-sm: 0 1px 2px 0 rgb(0 0 0 / 0.03);
-            --shadow-md: 0 4px 6px -1px rgb(0 0 0 / 0.05), 0 2px 4px -2px rgb(0 0 0 / 0.05);
-        }}
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: var(--background-color);
-            color: var(--text-primary);
-            margin: 0;
-            padding: 0;
-            min-height: 100vh;
-        }}
-        .container {{
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 2rem 1rem;
-        }}
-        .header {{
-            background: var(--surface-color);
-            border-bottom: 1px solid var(--border-color);
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            box-shadow: var(--shadow-sm);
-        }}
-        .header-content {{
-            display: flex;
-            align-items: center;
-            padding: 1rem 0;
-        }}
-        .logo {{
-            display: flex;
-            align-items: center;
-            gap: 0.75rem;
-            text-decoration: none;
-            color: var(--primary-color);
-        }}
-        .logo-icon {{
-            width: 36px;
-            height: 36px;
-            background: var(--primary-color);
-            border-radius: 6px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: #fff;
-            font-weight: 700;
-            font-size: 1.1rem;
-        }}
-        .logo-text {{
-            font-size: 1.3rem;
-            font-weight: 700;
-            color: var(--primary-color);
-        }}
-        .main-content {{
-            background: var(--surface-color);
-            border-radius: 12px;
-            box-shadow: var(--shadow-md);
-            margin: 2rem 0;
-            overflow: hidden;
-        }}
-        .markdown-body {{
-            box-sizing: border-box;
-            min-width: 200px;
-            max-width: none;
-            margin: 0;
-            padding: 2.5rem 2rem;
-            background: var(--surface-color);
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            color: var(--text-primary);
-        }}
-        .markdown-body h1 {{
-            font-size: 2.2rem;
-            font-weight: 700;
-            color: var(--primary-color);
-            margin-bottom: 1.2rem;
-            border-bottom: 2px solid var(--border-color);
-            padding-bottom: 0.5rem;
-        }}
-        .markdown-body h2 {{
-            font-size: 1.5rem;
-            font-weight: 600;
-            color: var(--primary-color);
-            margin-top: 2rem;
-            margin-bottom: 1rem;
-            border-bottom: 1px solid var(--border-color);
-            padding-bottom: 0.3rem;
-        }}
-        .markdown-body h3 {{
-            font-size: 1.15rem;
-            font-weight: 600;
-            color: var(--primary-color);
-            margin-top: 1.5rem;
-            margin-bottom: 0.75rem;
-        }}
-        .markdown-body h4 {{
-            font-size: 1.05rem;
-            font-weight: 600;
-            color: var(--primary-color);
-            margin-top: 1.2rem;
-            margin-bottom: 0.5rem;
-        }}
-        .markdown-body p {{
-            margin-bottom: 1.1rem;
-            color: var(--text-secondary);
-        }}
-        .markdown-body strong {{
-            color: var(--text-primary);
-            font-weight: 600;
-        }}
-        .markdown-body code {{
-            background: var(--code-bg);
-            color: var(--primary-color);
-            padding: 0.18rem 0.35rem;
-            border-radius: 4px;
-            font-size: 0.95em;
-            border: 1px solid var(--border-color);
-        }}
-        .markdown-body pre {{
-            background: var(--code-bg);
-            border-radius: 8px;
-            padding: 1.1rem;
-            overflow-x: auto;
-            border: 1px solid var(--border-color);
-        }}
-        .markdown-body pre code {{
-            background: none;
-            color: var(--primary-color);
-            padding: 0;
-            border: none;
-            font-size: 0.95em;
-        }}
-        .markdown-body blockquote {{
-            background: #f1f5f9;
-            color: var(--primary-color);
-            padding: 1rem 1.5rem;
-            border-radius: 6px;
-            margin: 1.2rem 0;
-            border-left: 4px solid var(--primary-color);
-        }}
-        .markdown-body blockquote p {{
-            color: var(--primary-color);
-            margin: 0;
-        }}
-        .markdown-body table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 1.2rem 0;
-            border-radius: 6px;
-            overflow: hidden;
-        }}
-        .markdown-body th {{
-            background: var(--primary-color);
-            color: #fff;
-            padding: 0.7rem;
-            text-align: left;
-            font-weight: 600;
-        }}
-        .markdown-body td {{
-            padding: 0.7rem;
-            border-bottom: 1px solid var(--border-color);
-            background: var(--surface-color);
-        }}
-        .markdown-body tr:nth-child(even) td {{
-            background: #f7fafc;
-        }}
-        .markdown-body ul, .markdown-body ol {{
-            padding-left: 1.3rem;
-            margin-bottom: 1.1rem;
-        }}
-        .markdown-body li {{
-            margin-bottom: 0.4rem;
-            color: var(--text-secondary);
-        }}
-        .markdown-body a {{
-            color: var(--primary-color);
-            text-decoration: underline;
-            font-weight: 500;
-            transition: color 0.2s ease;
-        }}
-        .markdown-body a:hover {{
-            color: var(--primary-hover);
-        }}
-        .github-corner {{
-            position: fixed;
-            top: 0;
-            right: 0;
-            z-index: 1000;
-        }}
-        .github-corner:hover .octo-arm {{
-            animation: octocat-wave 560ms ease-in-out;
-        }}
-        @keyframes octocat-wave {{
-            0%, 100% {{ transform: rotate(0); }}
-            20%, 60% {{ transform: rotate(-25deg); }}
-            40%, 80% {{ transform: rotate(10deg); }}
-        }}
-        .github-corner svg {{
-            fill: var(--primary-color);
-            color: #fff;
-            position: fixed;
-            top: 0;
-            border: 0;
-            right: 0;
-        }}
-        .github-corner .octo-arm {{
-            transform-origin: 130px 106px;
-        }}
-        .footer {{
-            background: var(--surface-color);
-            border-top: 1px solid var(--border-color);
-            padding: 1.5rem 0;
-            text-align: center;
-            color: var(--text-secondary);
-            margin-top: 2rem;
-        }}
-        .footer-content {{
-            max-width: 900px;
-            margin: 0 auto;
-        }}
-        .footer a {{
-            color: var(--primary-color);
-            text-decoration: underline;
-            font-weight: 500;
-        }}
-        .footer a:hover {{
-            color: var(--primary-hover);
-        }}
-        @media (max-width: 768px) {{
-            .container {{
-                padding: 1rem;
-            }}
-            .header-content {{
-                padding: 1rem 0;
-            }}
-            .markdown-body {{
-                padding: 1rem 0.5rem;
-            }}
-            .main-content {{
-                margin: 1rem 0;
-            }}
-            .logo-text {{
-                font-size: 1rem;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="assets/style.css?v=<!--CSS_VERSION-->">
 </head>
 <body>
-    <a href="https://github.com/DaKingKong/RingCX-gRPC-bot-guide" class="github-corner" aria-label="View source on GitHub">
-        <svg width="80" height="80" viewBox="0 0 250 250" aria-hidden="true">
-            <path d="M0,0 L115,115 L130,115 L142,142 L250,250 L250,0 Z"></path>
-            <path d="M128.3,109.0 C113.8,99.7 119.0,89.6 119.0,89.6 C122.0,82.7 120.5,78.6 120.5,78.6 C119.2,72.0 123.4,76.3 123.4,76.3 C127.3,80.9 125.5,87.3 125.5,87.3 C122.9,97.6 130.6,101.9 134.4,103.2" fill="currentColor" style="transform-origin: 130px 106px;" class="octo-arm"></path>
-            <path d="M115.0,115.0 C114.9,115.1 118.7,116.5 119.8,115.4 L133.7,101.6 C136.9,99.2 139.9,98.4 142.2,98.6 C133.8,88.0 127.5,74.4 143.8,58.0 C148.5,53.4 154.0,51.2 159.7,51.0 C160.3,49.4 163.2,43.6 171.4,40.1 C171.4,40.1 176.1,42.5 178.8,56.2 C183.1,58.6 187.2,61.8 190.9,65.4 C194.5,69.0 197.7,73.2 200.1,77.6 C213.8,80.2 216.3,84.9 216.3,84.9 C212.7,91.3 206.9,94.7 205.4,96.6 C205.1,102.4 203.0,107.8 198.3,112.5 C181.9,128.9 168.3,122.5 157.7,114.1 C157.9,116.9 156.7,120.9 152.7,124.9 L141.0,136.5 C139.8,137.7 141.6,141.9 141.8,141.8 Z" fill="currentColor" class="octo-body"></path>
-        </svg>
-    </a>
-
     <header class="header">
         <div class="header-content">
             <a href="#" class="logo">
                 <div class="logo-icon">R</div>
                 <div class="logo-text">RingCX Guide</div>
             </a>
+            <a href="https://github.com/DaKingKong/RingCX-gRPC-bot-guide" class="gh-link" aria-label="View source on GitHub">GitHub &#8599;</a>
         </div>
     </header>
 
     <div class="container">
         <main class="main-content">
             <article class="markdown-body">
-                {content}
+                <!--CONTENT-->
             </article>
         </main>
     </div>
@@ -355,119 +375,503 @@ def create_html_template():
 </body>
 </html>"""
 
-def convert_markdown_to_html(markdown_file):
-    """Convert Markdown file to HTML."""
-    print(f"Converting {markdown_file} to HTML...")
-    
-    # Read the markdown file
-    with open(markdown_file, 'r', encoding='utf-8') as f:
-        markdown_content = f.read()
-    
-    # Configure markdown extensions
-    extensions = [
-        'markdown.extensions.codehilite',
-        'markdown.extensions.fenced_code',
-        'markdown.extensions.tables',
-        'markdown.extensions.toc',
-        'markdown.extensions.def_list',
-        'markdown.extensions.abbr',
-        'markdown.extensions.footnotes'
-    ]
+def minify_css(css):
+    """Strip comments and redundant whitespace from a CSS stylesheet."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{}:;,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+def minify_html(html):
+    """Drop indentation and blank lines from an HTML template."""
+    return re.sub(r'\n\s*', '\n', html)
+
+# Set DEBUG_HTML=1 to emit the template and stylesheet unminified
+_DEBUG_HTML = bool(os.environ.get("DEBUG_HTML"))
+
+# Minified stylesheet, with a short content hash used to bust caches on change
+_CSS_BYTES = (_CSS if _DEBUG_HTML else minify_css(_CSS)).encode('utf-8')
+_CSS_VERSION = hashlib.sha256(_CSS_BYTES).hexdigest()[:8]
+
+# Minified, UTF-8 encoded template halves around the content marker, written
+# out on either side of the converted body so the full page is never
+# assembled in memory and only the body needs encoding per page.
+_HTML_PREFIX, _HTML_SUFFIX = (
+    part.encode('utf-8')
+    for part in (_HTML_TEMPLATE if _DEBUG_HTML else minify_html(_HTML_TEMPLATE))
+        .replace("<!--CSS_VERSION-->", _CSS_VERSION)
+        .split("<!--CONTENT-->", 1)
+)
+
+# Versioned CDN assets copied into docs/vendor at build time. The Prism
+# autoloader stays on the CDN because it loads language components from paths
+# relative to its own URL, and Google Fonts because its stylesheet is tailored
+# per browser and points at separately hosted font files.
+_VENDOR_ASSETS = {
+    "https://cdnjs.cloudflare.com/ajax/libs/github-markdown-css/5.2.0/github-markdown.min.css": "github-markdown.min.css",
+    "https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/themes/prism.min.css": "prism.min.css",
+    "https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/components/prism-core.min.js": "prism-core.min.js",
+}
+
+# Code blocks keep their language-* class and are highlighted client-side
+# by the Prism scripts in the template, so no codehilite/Pygments pass.
+# Every extension adds processors to each parse, so only the syntax the guide
+# uses is enabled (toc provides the heading ids used for #section links).
+_MARKDOWN_EXTENSIONS = [
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.tables',
+    'markdown.extensions.toc'
+]
+
+# Converted HTML fragments, content-addressed by fragment_cache_key()
+_CACHE_DIR = Path(".md-cache")
+
+@functools.lru_cache(maxsize=1)
+def get_markdown_converter():
+    """Build the Markdown converter once per process and reuse it."""
+    # Imported here so the package can be installed by install_dependencies()
+    # and so commands that never convert don't pay for loading it
+    import markdown
     
-    # Convert markdown to HTML
-    html_content = markdown.markdown(
-        markdown_content,
-        extensions=extensions,
-        extension_configs={
-            'codehilite': {
-                'css_class': 'highlight',
-                'use_pygments': True,
-                'noclasses': True
-            }
-        }
-    )
+    return markdown.Markdown(extensions=_MARKDOWN_EXTENSIONS)
+
+@functools.lru_cache(maxsize=None)
+def converter_fingerprint():
+    """Bytes identifying the converter: markdown's version and extensions."""
+    from importlib.metadata import version
     
-    # Get the HTML template
-    template = create_html_template()
+    return (version("markdown") + repr(_MARKDOWN_EXTENSIONS)).encode('utf-8')
+
+def fragment_cache_key(source):
+    """Cache key for a source's converted HTML under the current converter."""
+    h = hashlib.sha256(source)
+    h.update(converter_fingerprint())
+    return h.hexdigest()
+
+# Markdown sources read in this process, keyed by path -> (mtime_ns, size, bytes)
+_SOURCE_CACHE = {}
+
+def read_source(path):
+    """Return a source file's bytes, re-reading only if its stat changed."""
+    st = os.stat(path)
+    cached = _SOURCE_CACHE.get(str(path))
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    data = Path(path).read_bytes()
+    _SOURCE_CACHE[str(path)] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+# All HTML rewrites applied after conversion, fused into one pass:
+# bare code blocks get Prism's language-none class so they pick up the theme,
+# and relative links to converted Markdown files point at the generated page.
+_POSTPROCESS_RE = re.compile(r'(<pre><code>)|href="([^":#]+\.md)(#[^"]*)?"')
+
+def postprocess_html(html_content, links):
+    """Apply the _POSTPROCESS_RE rewrites; links maps .md names to pages."""
+    def replace(match):
+        if match.group(1):
+            return '<pre><code class="language-none">'
+        target = links.get(match.group(2))
+        if target is None:
+            return match.group(0)
+        return f'href="{target}{match.group(3) or ""}"'
     
-    # Insert the content into the template
-    final_html = template.format(content=html_content)
+    return _POSTPROCESS_RE.sub(replace, html_content)
+
+def convert_markdown_to_html(markdown_file, links=None):
+    """Convert Markdown file to an HTML fragment."""
+    # Read the markdown file (usually already cached by compute_build_hash)
+    source = read_source(markdown_file)
     
-    return final_html
+    # Reuse an earlier conversion of identical source if there is one
+    cache_path = _CACHE_DIR / f"{fragment_cache_key(source)}.html"
+    try:
+        html_content = cache_path.read_text(encoding='utf-8')
+        print(f"Using cached HTML for {markdown_file}")
+    except FileNotFoundError:
+        print(f"Converting {markdown_file} to HTML...")
+        
+        # Convert markdown to HTML
+        md = get_markdown_converter()
+        md.reset()
+        html_content = md.convert(source.decode('utf-8'))
+        
+        # Write atomically so parallel workers never see a partial entry
+        _CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(html_content, encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    
+    return postprocess_html(html_content, links or {})
 
-def setup_github_pages():
-    """Set up GitHub Pages configuration."""
-    print("Setting up GitHub Pages...")
+def prune_fragment_cache(markdown_files):
+    """Delete .md-cache entries other than those for the current sources.
     
-    # Create docs directory if it doesn't exist
-    docs_dir = Path("docs")
-    docs_dir.mkdir(exist_ok=True)
+    CI restores the previous run's cache and saves it under a new key, so
+    without pruning every past revision of every page would be carried along.
+    """
+    keep = {f"{fragment_cache_key(read_source(markdown_file))}.html" for markdown_file in markdown_files}
+    try:
+        entries = list(os.scandir(_CACHE_DIR))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.name not in keep:
+            os.unlink(entry.path)
+
+def file_matches(path, parts):
+    """Return True if the file at path consists exactly of the byte parts."""
+    try:
+        existing = memoryview(Path(path).read_bytes())
+    except FileNotFoundError:
+        return False
+    if len(existing) != sum(len(part) for part in parts):
+        return False
+    
+    offset = 0
+    for part in parts:
+        if existing[offset:offset + len(part)] != part:
+            return False
+        offset += len(part)
+    return True
+
+def write_html(markdown_file, out_path, prefix=_HTML_PREFIX, suffix=_HTML_SUFFIX, links=None):
+    """Convert a Markdown file and stream the templated page to out_path.
+    
+    Returns False without touching the file if it already holds this page.
+    """
+    body = convert_markdown_to_html(markdown_file, links).encode('utf-8')
+    if file_matches(out_path, (prefix, body, suffix)):
+        return False
+    
+    with open(out_path, 'wb', buffering=1 << 20) as f:
+        f.write(prefix)
+        f.write(body)
+        f.write(suffix)
+    return True
+
+def convert_all(pages, prefix=_HTML_PREFIX, suffix=_HTML_SUFFIX):
+    """Convert (markdown_file, out_path) pairs, one worker process per page.
+    
+    Returns a list of write_html() results in page order.
+    """
+    # Links between pages of this build resolve to their generated files
+    links = {Path(markdown_file).name: Path(out_path).name for markdown_file, out_path in pages}
+    
+    if len(pages) < 2:
+        # Spawning a pool for a single page costs more than it saves
+        return [
+            write_html(markdown_file, out_path, prefix, suffix, links)
+            for markdown_file, out_path in pages
+        ]
     
-    # Create index.html in docs directory
-    markdown_file = "RingCX_gRPC_Streaming_Guide.md"
-    html_content = convert_markdown_to_html(markdown_file)
+    markdown_files, out_paths = zip(*pages)
+    with ProcessPoolExecutor(max_workers=min(len(pages), os.cpu_count() or 1)) as executor:
+        return list(executor.map(
+            write_html,
+            markdown_files,
+            out_paths,
+            itertools.repeat(prefix),
+            itertools.repeat(suffix),
+            itertools.repeat(links)
+        ))
+
+def fetch_url(url):
+    """Download a URL and return its body, or None if it can't be fetched."""
+    import urllib.error
+    import urllib.request
+    
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            return response.read()
+    except (urllib.error.URLError, OSError) as e:
+        print(f"Warning: could not download {url}: {e}")
+        return None
+
+# CDN URLs that failed to download in this process; --watch rebuilds don't
+# retry them, so an offline session doesn't stall or warn on every save
+_FAILED_DOWNLOADS = set()
+
+def vendor_assets(docs_dir):
+    """Copy the template's CDN assets into docs/vendor and return URL rewrites.
     
-    with open(docs_dir / "index.html", 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    Serving them from the Pages origin saves a DNS lookup and TLS handshake
+    per CDN host on a cold load. Assets are pinned to versioned URLs, so a
+    file that was vendored on an earlier run is reused as-is. Any asset that
+    can't be downloaded keeps its CDN link.
+    """
+    vendor_dir = docs_dir / "vendor"
+    vendor_dir.mkdir(exist_ok=True)
     
-    print("✓ Created docs/index.html")
+    missing = [
+        url for url, name in _VENDOR_ASSETS.items()
+        if url not in _FAILED_DOWNLOADS and not (vendor_dir / name).exists()
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        downloads = dict(zip(missing, executor.map(fetch_url, missing)))
+    _FAILED_DOWNLOADS.update(url for url, body in downloads.items() if body is None)
     
-    # Create a simple README for the docs directory
-    docs_readme = """# RingCX gRPC Streaming Guide
+    rewrites = {}
+    for url, name in _VENDOR_ASSETS.items():
+        asset_path = vendor_dir / name
+        if url in _FAILED_DOWNLOADS:
+            continue
+        if url in downloads:
+            asset_path.write_bytes(downloads[url])
+            print(f"✓ Vendored {url}")
+        digest = hashlib.sha384(asset_path.read_bytes()).digest()
+        integrity = "sha384-" + base64.b64encode(digest).decode("ascii")
+        rewrites[url] = f'vendor/{name}" integrity="{integrity}'
+    return rewrites
+
+def rewrite_asset_urls(html, rewrites):
+    """Point quoted asset URLs in encoded html at their vendored copies."""
+    for url, replacement in rewrites.items():
+        html = html.replace(f'"{url}"'.encode('utf-8'), f'"{replacement}"'.encode('utf-8'))
+    return html
+
+def compress_brotli(data):
+    """Brotli-compress data, or return None if the brotli module is missing."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli.compress(data, quality=11)
+
+def precompress(path):
+    """Write .gz (and .br, if brotli is installed) copies of a file beside it."""
+    data = Path(path).read_bytes()
+    
+    # mtime=0 keeps the .gz byte-identical across rebuilds of the same page
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        gz = executor.submit(gzip.compress, data, compresslevel=9, mtime=0)
+        br = executor.submit(compress_brotli, data)
+        Path(f"{path}.gz").write_bytes(gz.result())
+        if br.result() is not None:
+            Path(f"{path}.br").write_bytes(br.result())
+        else:
+            # Without brotli, a .br from an earlier build would go stale
+            Path(f"{path}.br").unlink(missing_ok=True)
+
+def compute_build_hash(pages, prefix, suffix):
+    """Hash everything that feeds the generated pages."""
+    h = hashlib.blake2b(digest_size=16)
+    # This script's own source covers changes to the conversion itself
+    h.update(Path(__file__).read_bytes())
+    # ...and the converter covers markdown upgrades or pin bumps
+    h.update(converter_fingerprint())
+    h.update(prefix)
+    h.update(suffix)
+    for markdown_file, out_path in pages:
+        h.update(str(out_path).encode('utf-8'))
+        h.update(read_source(markdown_file))
+    return h.hexdigest()
+
+# README for the docs directory, encoded once
+_DOCS_README = """# RingCX gRPC Streaming Guide
 
 This directory contains the GitHub Pages site for the RingCX gRPC Streaming Implementation Guide.
 
 The main content is in `index.html` which is automatically generated from the Markdown file.
+`index.html.gz` (and `index.html.br` when Brotli is available) are precompressed copies of it.
+Jekyll is intentionally disabled by `.nojekyll`, since the pages are already final HTML.
+""".encode('utf-8')
+
+# Cache rules for hosts that read a _headers file (Cloudflare Pages, Netlify)
+# if docs/ is deployed there. GitHub Pages and plain proxies in front of it
+# ignore this file. Vendored assets have versioned names and the stylesheet is
+# referenced with a content-hash query, so neither changes under its URL.
+_HEADERS = b"""/vendor/*
+  Cache-Control: public, max-age=31536000, immutable
+/assets/style.css
+  Cache-Control: public, max-age=31536000, immutable
+/
+  Cache-Control: public, max-age=600
+/*.html
+  Cache-Control: public, max-age=600
 """
+
+# Static files written alongside the generated pages
+_STATIC_FILES = {
+    "README.md": _DOCS_README,
+    "assets/style.css": _CSS_BYTES,
+    "_headers": _HEADERS,
+    # Pages are final HTML, so branch deploys skip the Jekyll build (which
+    # would otherwise also drop underscore-prefixed files like _headers)
+    ".nojekyll": b"",
+}
+
+def write_bytes(path, data):
+    """Write data to path with raw os-level calls, bypassing Python's buffering."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def write_if_changed(path, data):
+    """Write data to path unless the file already holds exactly those bytes."""
+    if file_matches(path, (data,)):
+        return False
+    write_bytes(path, data)
+    return True
+
+def copy_static_assets(src_dir, dst_dir, exclude=()):
+    """Mirror files under src_dir (images, diagrams, ...) into dst_dir.
+    
+    shutil.copyfile copies in the kernel where it can (os.sendfile on Linux,
+    fcopyfile on macOS); files whose copy is already current are skipped.
+    Paths in exclude (relative to src_dir) are left to their other writer.
+    """
+    import shutil
     
-    with open(docs_dir / "README.md", 'w', encoding='utf-8') as f:
-        f.write(docs_readme)
+    src_dir = Path(src_dir)
+    if not src_dir.is_dir():
+        return
     
-    print("✓ Created docs/README.md")
+    for src in src_dir.rglob('*'):
+        if not src.is_file():
+            continue
+        relative = src.relative_to(src_dir)
+        if relative.as_posix() in exclude:
+            continue
+        dst = Path(dst_dir) / relative
+        src_stat = src.stat()
+        try:
+            dst_stat = dst.stat()
+            if (dst_stat.st_size == src_stat.st_size
+                    and dst_stat.st_mtime_ns >= src_stat.st_mtime_ns):
+                continue
+        except FileNotFoundError:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(src, dst)
+        print(f"✓ Copied {src} to {dst}")
 
-def create_github_workflow():
-    """Create GitHub Actions workflow for automatic deployment."""
-    print("Creating GitHub Actions workflow...")
+# Site pages as (Markdown source, output file under docs/)
+_PAGES = [
+    ("RingCX_gRPC_Streaming_Guide.md", "index.html"),
+]
+
+def setup_github_pages():
+    """Set up GitHub Pages configuration."""
+    print("Setting up GitHub Pages...")
     
-    # Create .github/workflows directory
-    workflows_dir = Path(".github/workflows")
-    workflows_dir.mkdir(parents=True, exist_ok=True)
+    # Create docs directory if it doesn't exist
+    docs_dir = Path("docs")
+    (docs_dir / "assets").mkdir(parents=True, exist_ok=True)
     
-    workflow_content = """name: Deploy to GitHub Pages
+    # Static files don't depend on the pages, so write them in the background
+    with ThreadPoolExecutor(max_workers=len(_STATIC_FILES)) as executor:
+        static_writes = {
+            name: executor.submit(write_if_changed, docs_dir / name, data)
+            for name, data in _STATIC_FILES.items()
+        }
+        
+        # Images and other files the guide links to under assets/. The
+        # generated files in docs/assets/ (style.css) always win over a
+        # same-named source file; they are being written concurrently and
+        # _headers marks style.css immutable.
+        generated = {
+            name.split("/", 1)[1] for name in _STATIC_FILES if name.startswith("assets/")
+        }
+        copy_static_assets("assets", docs_dir / "assets", exclude=generated)
+        
+        # Serve CDN assets from the site itself where possible
+        rewrites = vendor_assets(docs_dir)
+        prefix = rewrite_asset_urls(_HTML_PREFIX, rewrites)
+        suffix = rewrite_asset_urls(_HTML_SUFFIX, rewrites)
+        
+        # Create index.html (and any further pages) in docs directory
+        pages = [(markdown_file, docs_dir / page) for markdown_file, page in _PAGES]
+        # Skip conversion when neither the sources nor the template changed
+        build_hash = compute_build_hash(pages, prefix, suffix)
+        stamp = docs_dir / ".build-hash"
+        if (stamp.exists() and stamp.read_text(encoding='utf-8') == build_hash
+                and all(Path(out_path).exists() for _, out_path in pages)):
+            print("✓ docs/index.html is up to date")
+        else:
+            written = convert_all(pages, prefix, suffix)
+            
+            # Precompressed variants for servers/CDNs that can serve them directly
+            for (_, out_path), changed in zip(pages, written):
+                if changed or not Path(f"{out_path}.gz").exists():
+                    precompress(out_path)
+                    print(f"✓ Created {out_path} and precompressed variants")
+                else:
+                    print(f"✓ {out_path} unchanged")
+            
+            stamp.write_text(build_hash, encoding='utf-8')
+        
+        prune_fragment_cache(markdown_file for markdown_file, _ in pages)
+        
+        for name, future in static_writes.items():
+            if future.result():
+                print(f"✓ Created docs/{name}")
+            else:
+                print(f"✓ docs/{name} unchanged")
+
+# GitHub Actions workflow written by create_github_workflow()
+_WORKFLOW_YAML = b"""name: Deploy to GitHub Pages
 
 on:
   push:
     branches: [ main, master ]
-  pull_request:
-    branches: [ main, master ]
+    paths:
+      - '*.md'
+      - 'assets/**'
+      - 'publish_to_github_pages.py'
+      - 'requirements.txt'
+      - '.github/workflows/deploy.yml'
+  workflow_dispatch:
 
 permissions:
   contents: read
   pages: write
   id-token: write
 
-concurrency:
-  group: "pages"
-  cancel-in-progress: false
-
 jobs:
   build:
     runs-on: ubuntu-latest
+    # A newer push makes an in-flight build obsolete
+    concurrency:
+      group: "pages-build-${{ github.ref }}"
+      cancel-in-progress: true
     steps:
     - name: Checkout
       uses: actions/checkout@v4
       
     - name: Set up Python
-      uses: actions/setup-python@v4
+      uses: actions/setup-python@v5
       with:
         python-version: '3.11'
+        cache: 'pip'
+        cache-dependency-path: 'requirements.txt'
+        
+    - name: Restore generated site
+      id: docs-cache
+      uses: actions/cache@v4
+      with:
+        path: docs
+        key: docs-${{ hashFiles('*.md', 'assets/**', 'publish_to_github_pages.py', 'requirements.txt') }}
+        
+    - name: Restore converted Markdown cache
+      if: steps.docs-cache.outputs.cache-hit != 'true'
+      uses: actions/cache@v4
+      with:
+        path: .md-cache
+        key: mdcache-${{ hashFiles('*.md', 'publish_to_github_pages.py') }}
+        restore-keys: mdcache-
         
     - name: Install dependencies
+      if: steps.docs-cache.outputs.cache-hit != 'true'
       run: |
         python -m pip install --upgrade pip
-        pip install markdown PyGithub
+        pip install -r requirements.txt
         
     - name: Generate HTML
+      if: steps.docs-cache.outputs.cache-hit != 'true'
       run: |
         python publish_to_github_pages.py --generate-only
         
@@ -485,17 +889,58 @@ jobs:
       url: ${{ steps.deployment.outputs.page_url }}
     runs-on: ubuntu-latest
     needs: build
+    # Never interrupt a Pages deployment that has already started
+    concurrency:
+      group: "pages"
+      cancel-in-progress: false
     if: github.ref == 'refs/heads/main' || github.ref == 'refs/heads/master'
     steps:
     - name: Deploy to GitHub Pages
       id: deployment
       uses: actions/deploy-pages@v4
 """
+
+def watch_github_pages(interval=0.25):
+    """Rebuild the site whenever a page source changes, until interrupted.
+    
+    The Markdown converter stays loaded between rebuilds, so each one costs
+    only the conversion and writes.
+    """
+    import time
+    
+    sources = [markdown_file for markdown_file, _ in _PAGES]
+    print(f"Watching {', '.join(sources)} for changes (Ctrl+C to stop)...")
+    
+    last_mtimes = None
+    try:
+        while True:
+            try:
+                mtimes = [os.stat(source).st_mtime_ns for source in sources]
+            except FileNotFoundError:
+                # Editors may briefly remove a file while saving it
+                mtimes = last_mtimes
+            if mtimes != last_mtimes:
+                # A half-saved file can break one rebuild; the next save retries
+                try:
+                    setup_github_pages()
+                except Exception as e:
+                    print(f"Error: rebuild failed: {type(e).__name__}: {e}")
+                last_mtimes = mtimes
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\n✓ Stopped watching")
+
+def create_github_workflow():
+    """Create GitHub Actions workflow for automatic deployment.
     
-    with open(workflows_dir / "deploy.yml", 'w', encoding='utf-8') as f:
-        f.write(workflow_content)
+    Returns True if the file was written. Nothing is printed, so this can run
+    on a worker thread without interleaving with the caller's output.
+    """
+    # Create .github/workflows directory
+    workflows_dir = Path(".github/workflows")
+    workflows_dir.mkdir(parents=True, exist_ok=True)
     
-    print("✓ Created .github/workflows/deploy.yml")
+    return write_if_changed(workflows_dir / "deploy.yml", _WORKFLOW_YAML)
 
 def update_repository_settings():
     """Provide instructions for updating repository settings."""
@@ -526,27 +971,55 @@ def main():
     print("RingCX gRPC Streaming Guide - GitHub Pages Publisher")
     print("=" * 55)
     
+    # One directory listing answers both the repository and source checks
+    with os.scandir(".") as it:
+        entries = {entry.name for entry in it}
+    
     # Check if we're in a git repository
-    if not Path(".git").exists():
+    if ".git" not in entries:
         print("Error: This script must be run from a Git repository.")
         sys.exit(1)
     
-    # Install dependencies
-    if not install_dependencies():
-        print("Error: Failed to install dependencies.")
+    missing = [markdown_file for markdown_file, _ in _PAGES if markdown_file not in entries]
+    if missing:
+        print(f"Error: Guide source not found: {', '.join(missing)}")
         sys.exit(1)
     
     # Check command line arguments
     generate_only = "--generate-only" in sys.argv
+    watch = "--watch" in sys.argv
+    skip_install = generate_only or "--skip-install" in sys.argv
+    
+    if "--clear-cache" in sys.argv:
+        import shutil
+        
+        shutil.rmtree(_CACHE_DIR, ignore_errors=True)
+        # Without the stamp the next build can't call the pages up to date
+        Path("docs/.build-hash").unlink(missing_ok=True)
+        print(f"✓ Cleared {_CACHE_DIR}/ and docs/.build-hash")
     
-    if generate_only:
+    # Install dependencies (CI installs them in its own workflow step)
+    if not skip_install and not install_dependencies():
+        print("Error: Failed to install dependencies.")
+        sys.exit(1)
+    
+    if watch:
+        watch_github_pages()
+    elif generate_only:
         print("Generating HTML only...")
         setup_github_pages()
         print("✓ HTML generation complete!")
     else:
-        # Full setup
-        setup_github_pages()
-        create_github_workflow()
+        # Full setup; the workflow file is independent of the site, so write
+        # it on a worker thread while the pages are generated
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            workflow = executor.submit(create_github_workflow)
+            setup_github_pages()
+            print("Creating GitHub Actions workflow...")
+            if workflow.result():
+                print("✓ Created .github/workflows/deploy.yml")
+            else:
+                print("✓ .github/workflows/deploy.yml unchanged")
         update_repository_settings()
         
         print("\n" + "="*60)